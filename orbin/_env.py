@@ -0,0 +1,26 @@
+"""
+Environment loading for Orbin framework.
+
+Parses an application's .env file at most once per process.
+"""
+
+from pathlib import Path
+from typing import Optional, Set
+
+_loaded_paths: Set[str] = set()
+
+
+def load_env(env_path: Optional[Path] = None) -> None:
+    """
+    Load variables from a .env file unless it was already loaded.
+    
+    Args:
+        env_path: Path to the .env file. Defaults to .env in the current directory.
+    """
+    path = str(env_path if env_path is not None else Path.cwd() / ".env")
+    if path in _loaded_paths:
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv(path)
+    _loaded_paths.add(path)
@@ -6,52 +6,91 @@ Provides generators and utilities for building AI-powered chat applications.
 
 import sys
 import os
+import re
 import subprocess
 import argparse
 from pathlib import Path
-from typing import Optional, List
-from .generators.app_generator import AppGenerator
-from .generators.model_generator import ModelGenerator
-from .generators.controller_generator import ControllerGenerator
-from .generators.resource_generator import ResourceGenerator
-from .generators.scaffold_generator import ScaffoldGenerator
-from .database import create_database, migrate_database, prepare_test_database
+from typing import Any, Dict, Optional, List
+
+# Generators and database helpers pull in Jinja2, inflect and psycopg2, so they
+# are imported inside the commands that need them to keep CLI startup fast.
+
+
+_APP_ENTRIES = frozenset({"app", "config", "pyproject.toml"})
 
 
 def is_orbin_app() -> bool:
     """Check if current directory is an Orbin application."""
     current_dir = Path.cwd()
     
-    # Check for Orbin app indicators
-    indicators = [
-        current_dir / "app" / "main.py",
-        current_dir / "config" / "settings.py",
-        current_dir / "pyproject.toml"
-    ]
+    # One directory listing rules out most non-app directories without extra stats
+    try:
+        with os.scandir(current_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False
     
-    return all(indicator.exists() for indicator in indicators)
+    if not _APP_ENTRIES <= names:
+        return False
+    
+    # Check for Orbin app indicators
+    return (
+        (current_dir / "app" / "main.py").is_file()
+        and (current_dir / "config" / "settings.py").is_file()
+    )
+
+
+_APP_NAME_RE = re.compile(r'\s*APP_NAME\s*:\s*str\s*=\s*"([^"]+)"')
+_app_name_cache: Dict[Path, str] = {}
 
 
 def get_app_name() -> str:
     """Get the application name from the current directory."""
+    current_dir = Path.cwd()
+    app_name = _app_name_cache.get(current_dir)
+    if app_name is None:
+        app_name = _read_app_name(current_dir)
+        _app_name_cache[current_dir] = app_name
+    return app_name
+
+
+def _read_app_name(app_dir: Path) -> str:
+    """Read the application name from config/settings.py in app_dir."""
     try:
-        # Try to get from settings.py
-        settings_path = Path.cwd() / "config" / "settings.py"
-        if settings_path.exists():
-            content = settings_path.read_text()
-            for line in content.split('\n'):
-                if 'APP_NAME:' in line and '=' in line:
-                    # Extract app name from line like: APP_NAME: str = "my_app"
-                    return line.split('"')[1]
-    except:
+        # Try to get from settings.py, e.g. APP_NAME: str = "my_app"
+        settings_path = app_dir / "config" / "settings.py"
+        if settings_path.is_file():
+            # Stop reading at the first match; APP_NAME sits near the top
+            with settings_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if "APP_NAME" in line:
+                        match = _APP_NAME_RE.match(line)
+                        if match:
+                            return match.group(1)
+    except (OSError, UnicodeDecodeError):
         pass
     
     # Fallback to directory name
-    return Path.cwd().name
+    return app_dir.name
+
+
+def _enable_verbose_output() -> None:
+    """Show the generators' per-file progress messages."""
+    import logging
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    generator_logger = logging.getLogger("orbin.generator")
+    generator_logger.addHandler(handler)
+    generator_logger.setLevel(logging.DEBUG)
 
 
-def create_app(app_name: str, target_dir: Optional[str] = None):
+def create_app(app_name: str, target_dir: Optional[str] = None, verbose: bool = False):
     """Create a new Orbin application."""
+    if verbose:
+        _enable_verbose_output()
+    
+    from .generators.app_generator import AppGenerator
     generator = AppGenerator(app_name, target_dir)
     generator.generate()
 
@@ -63,6 +102,7 @@ def generate_model(model_name: str, attributes: List[str]):
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .generators.model_generator import ModelGenerator
     generator = ModelGenerator(model_name, attributes)
     generator.generate()
 
@@ -74,6 +114,7 @@ def generate_controller(controller_name: str, actions: List[str]):
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .generators.controller_generator import ControllerGenerator
     generator = ControllerGenerator(controller_name, actions)
     generator.generate()
 
@@ -85,6 +126,7 @@ def generate_resource(model_name: str):
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .generators.resource_generator import ResourceGenerator
     generator = ResourceGenerator(model_name)
     generator.generate()
 
@@ -96,6 +138,7 @@ def generate_scaffold(model_name: str, attributes: List[str]):
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .generators.scaffold_generator import ScaffoldGenerator
     generator = ScaffoldGenerator(model_name, attributes)
     generator.generate()
 
@@ -107,6 +150,7 @@ def db_create():
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .database import create_database
     success = create_database()
     if not success:
         sys.exit(1)
@@ -119,6 +163,7 @@ def db_migrate():
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .database import migrate_database
     success = migrate_database()
     if not success:
         sys.exit(1)
@@ -131,6 +176,7 @@ def db_test_prepare():
         print("Run this command from within an Orbin app directory")
         sys.exit(1)
     
+    from .database import prepare_test_database
     success = prepare_test_database()
     if not success:
         sys.exit(1)
@@ -144,8 +190,8 @@ def db_console():
         sys.exit(1)
     
     # Load database URL from environment
-    from dotenv import load_dotenv
-    load_dotenv(Path.cwd() / ".env")
+    from ._env import load_env
+    load_env()
     
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
@@ -188,8 +234,8 @@ def redis_console():
         sys.exit(1)
     
     # Load Redis URL from environment
-    from dotenv import load_dotenv
-    load_dotenv(Path.cwd() / ".env")
+    from ._env import load_env
+    load_env()
     
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     app_name = get_app_name()
@@ -242,8 +288,8 @@ def redis_ping():
         sys.path.insert(0, os.getcwd())
         
         from orbin.redis_client import get_redis_client
-        from dotenv import load_dotenv
-        load_dotenv(Path.cwd() / ".env")
+        from ._env import load_env
+        load_env()
         
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         
@@ -307,6 +353,7 @@ def run_tests(test_path: Optional[str] = None, verbose: bool = False, skip_prepa
     
     # Prepare test database unless skipped
     if not skip_prepare:
+        from .database import prepare_test_database
         print("🔄 Preparing test database...")
         if not prepare_test_database():
             print("❌ Failed to prepare test database")
@@ -376,88 +423,93 @@ def start_console():
     print("  - config.database (Database connection)")
     print("  - config.redis (Redis client)")
     
-    # Create startup script for the console
-    startup_script = """
-# Orbin Console - Auto-imports
-import os
-import sys
-from datetime import datetime
-from pathlib import Path
-
-# Add current directory to Python path
-sys.path.insert(0, os.getcwd())
-
-# Import common modules
-try:
-    from app.main import app
-    print("✅ Imported: app (FastAPI application)")
-except ImportError as e:
-    print(f"⚠️  Could not import app.main: {e}")
-
-try:
-    from config.settings import settings
-    print("✅ Imported: settings (Application settings)")
-except ImportError as e:
-    print(f"⚠️  Could not import config.settings: {e}")
-
-try:
-    from config.database import get_db, Base, engine
-    print("✅ Imported: get_db, Base, engine (Database)")
-except ImportError as e:
-    print(f"⚠️  Could not import config.database: {e}")
-
-try:
-    from config.redis import redis_client, cache_set, cache_get
-    print("✅ Imported: redis_client, cache_set, cache_get (Redis)")
-except ImportError as e:
-    print(f"⚠️  Could not import config.redis: {e}")
-
-# Try to import SQLAlchemy session
-try:
-    from sqlalchemy.orm import sessionmaker
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    print("✅ Imported: session (Database session)")
-except ImportError as e:
-    print(f"⚠️  Could not create database session: {e}")
-
-print("\\n🎯 Ready! Try: app.title, settings.APP_NAME, redis_client.ping(), or session.execute('SELECT 1')")
-print("📚 Type help() for Python help, or dir() to see available objects")
-"""
-    
-    # Write startup script to temp file
-    import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write(startup_script)
-        startup_file = f.name
+    # Build the console namespace in this process instead of starting a new interpreter
+    sys.path.insert(0, os.getcwd())
+    namespace = _build_console_namespace()
+    banner = (
+        "\n🎯 Ready! Try: app.title, settings.APP_NAME, redis_client.ping(), or session.execute('SELECT 1')\n"
+        "📚 Type help() for Python help, or dir() to see available objects"
+    )
     
     try:
         # Start IPython if available, otherwise fall back to standard Python
         try:
-            subprocess.run([
-                sys.executable, "-c", 
-                f"import IPython; IPython.start_ipython(argv=['-i', '{startup_file}'])"
-            ], check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Fall back to standard Python REPL
+            import IPython
+        except ImportError:
             print("📝 IPython not available, using standard Python console")
-            subprocess.run([
-                sys.executable, "-i", startup_file
-            ], check=True)
+            import code
+            code.interact(banner=banner, local=namespace, exitmsg="👋 Console closed")
+        else:
+            IPython.embed(user_ns=namespace, banner1=banner)
     except KeyboardInterrupt:
         print("\n👋 Console closed")
-    finally:
-        # Clean up temp file
+
+
+def _build_console_namespace() -> Dict[str, Any]:
+    """Import the app's common modules for the interactive console."""
+    import importlib
+    from datetime import datetime
+    
+    namespace: Dict[str, Any] = {"os": os, "sys": sys, "datetime": datetime, "Path": Path}
+    imports = [
+        ("app.main", ["app"], "app (FastAPI application)"),
+        ("config.settings", ["settings"], "settings (Application settings)"),
+        ("config.database", ["get_db", "Base", "engine"], "get_db, Base, engine (Database)"),
+        ("config.redis", ["redis_client", "cache_set", "cache_get"], "redis_client, cache_set, cache_get (Redis)"),
+    ]
+    
+    for module_name, names, description in imports:
         try:
-            os.unlink(startup_file)
-        except:
-            pass
+            module = importlib.import_module(module_name)
+            namespace.update({name: getattr(module, name) for name in names})
+            print(f"✅ Imported: {description}")
+        except Exception as e:
+            print(f"⚠️  Could not import {module_name}: {e}")
+    
+    # Try to create SQLAlchemy session
+    try:
+        from sqlalchemy.orm import sessionmaker
+        Session = sessionmaker(bind=namespace["engine"])
+        namespace["session"] = Session()
+        print("✅ Imported: session (Database session)")
+    except Exception as e:
+        print(f"⚠️  Could not create database session: {e}")
+    
+    return namespace
+
+
+# Top-level commands (and aliases) accepted inside and outside an app
+_APP_COMMANDS = frozenset({
+    "server", "s", "console", "c", "test", "t", "generate", "g",
+    "db-create", "db-migrate", "db-test-prepare", "db", "redis", "redis-ping", "version",
+})
+_FRAMEWORK_COMMANDS = frozenset({"create", "version"})
 
 
 def main():
     """Main CLI entry point."""
+    # Fast path for the most common commands, skipping argparse entirely
+    argv = sys.argv[1:]
+    if argv == ["version"]:
+        from . import __version__
+        print(f"Orbin {__version__}")
+        return
+    if argv in (["server"], ["s"]):
+        start_server()
+        return
+
     in_app = is_orbin_app()
     
+    # Only build the subparser for the requested command. Help, errors and
+    # unknown commands still get the full tree so argparse can list every choice.
+    command = argv[0] if argv else None
+    known_commands = _APP_COMMANDS if in_app else _FRAMEWORK_COMMANDS
+    build_all = command not in known_commands
+    
+    def wants(*names: str) -> bool:
+        """Check whether the subparser for one of these command names is needed."""
+        return build_all or command in names
+    
     if in_app:
         app_name = get_app_name()
         parser = argparse.ArgumentParser(
@@ -468,90 +520,101 @@ def main():
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
         
         # Server command
-        server_parser = subparsers.add_parser(
-            "server", 
-            aliases=["s"],
-            help="Start the development server"
-        )
-        server_parser.add_argument(
-            "-p", "--port",
-            type=int,
-            default=8000,
-            help="Port to run the server on (default: 8000)"
-        )
-        server_parser.add_argument(
-            "-b", "--bind",
-            default="127.0.0.1",
-            help="IP address to bind to (default: 127.0.0.1)"
-        )
+        if wants("server", "s"):
+            server_parser = subparsers.add_parser(
+                "server", 
+                aliases=["s"],
+                help="Start the development server"
+            )
+            server_parser.add_argument(
+                "-p", "--port",
+                type=int,
+                default=8000,
+                help="Port to run the server on (default: 8000)"
+            )
+            server_parser.add_argument(
+                "-b", "--bind",
+                default="127.0.0.1",
+                help="IP address to bind to (default: 127.0.0.1)"
+            )
         
         # Console command
-        console_parser = subparsers.add_parser(
-            "console",
-            aliases=["c"],
-            help="Start interactive Python console with app context"
-        )
+        if wants("console", "c"):
+            console_parser = subparsers.add_parser(
+                "console",
+                aliases=["c"],
+                help="Start interactive Python console with app context"
+            )
         
         # Test command
-        test_parser = subparsers.add_parser(
-            "test",
-            aliases=["t"],
-            help="Run tests using pytest"
-        )
-        test_parser.add_argument(
-            "test_path",
-            nargs="?",
-            help="Specific test file or directory (defaults to tests/)"
-        )
-        test_parser.add_argument(
-            "-v", "--verbose",
-            action="store_true",
-            help="Run tests in verbose mode"
-        )
-        test_parser.add_argument(
-            "--skip-prepare",
-            action="store_true",
-            help="Skip test database preparation (faster for repeated test runs)"
-        )
+        if wants("test", "t"):
+            test_parser = subparsers.add_parser(
+                "test",
+                aliases=["t"],
+                help="Run tests using pytest"
+            )
+            test_parser.add_argument(
+                "test_path",
+                nargs="?",
+                help="Specific test file or directory (defaults to tests/)"
+            )
+            test_parser.add_argument(
+                "-v", "--verbose",
+                action="store_true",
+                help="Run tests in verbose mode"
+            )
+            test_parser.add_argument(
+                "--skip-prepare",
+                action="store_true",
+                help="Skip test database preparation (faster for repeated test runs)"
+            )
         
         # Generate command group
-        generate_parser = subparsers.add_parser("generate", aliases=["g"], help="Generate code")
-        generate_subparsers = generate_parser.add_subparsers(dest="generate_type", help="What to generate")
-        
-        # Generate model command
-        model_parser = generate_subparsers.add_parser("model", help="Generate a model with migration")
-        model_parser.add_argument("model_name", help="Name of the model (singular or plural)")
-        model_parser.add_argument("attributes", nargs="*", help="Model attributes (e.g., name:string age:integer)")
-        
-        # Generate controller command
-        controller_parser = generate_subparsers.add_parser("controller", help="Generate a controller with actions")
-        controller_parser.add_argument("controller_name", help="Name of the controller (e.g., Users, PostsController)")
-        controller_parser.add_argument("actions", nargs="*", help="Controller actions (e.g., index show create update destroy)")
-        
-        # Set default actions if none provided
-        controller_parser.set_defaults(actions=["index", "show", "create", "update", "destroy"])
-        
-        # Generate resource command
-        resource_parser = generate_subparsers.add_parser("resource", help="Generate RESTful controller for existing model")
-        resource_parser.add_argument("model_name", help="Name of the existing model (e.g., User, Post)")
-        
-        # Generate scaffold command
-        scaffold_parser = generate_subparsers.add_parser("scaffold", help="Generate model + migration + RESTful controller")
-        scaffold_parser.add_argument("model_name", help="Name of the model to create (e.g., User, Post)")
-        scaffold_parser.add_argument("attributes", nargs="*", help="Model attributes (e.g., name:string email:string)")
+        if wants("generate", "g"):
+            generate_parser = subparsers.add_parser("generate", aliases=["g"], help="Generate code")
+            generate_subparsers = generate_parser.add_subparsers(dest="generate_type", help="What to generate")
+            
+            # Generate model command
+            model_parser = generate_subparsers.add_parser("model", help="Generate a model with migration")
+            model_parser.add_argument("model_name", help="Name of the model (singular or plural)")
+            model_parser.add_argument("attributes", nargs="*", help="Model attributes (e.g., name:string age:integer)")
+            
+            # Generate controller command
+            controller_parser = generate_subparsers.add_parser("controller", help="Generate a controller with actions")
+            controller_parser.add_argument("controller_name", help="Name of the controller (e.g., Users, PostsController)")
+            controller_parser.add_argument("actions", nargs="*", help="Controller actions (e.g., index show create update destroy)")
+            
+            # Set default actions if none provided
+            controller_parser.set_defaults(actions=["index", "show", "create", "update", "destroy"])
+            
+            # Generate resource command
+            resource_parser = generate_subparsers.add_parser("resource", help="Generate RESTful controller for existing model")
+            resource_parser.add_argument("model_name", help="Name of the existing model (e.g., User, Post)")
+            
+            # Generate scaffold command
+            scaffold_parser = generate_subparsers.add_parser("scaffold", help="Generate model + migration + RESTful controller")
+            scaffold_parser.add_argument("model_name", help="Name of the model to create (e.g., User, Post)")
+            scaffold_parser.add_argument("attributes", nargs="*", help="Model attributes (e.g., name:string email:string)")
         
         # Database commands
-        db_create_parser = subparsers.add_parser("db-create", help="Create the PostgreSQL databases (development and test)")
-        db_migrate_parser = subparsers.add_parser("db-migrate", help="Run database migrations")
-        db_test_prepare_parser = subparsers.add_parser("db-test-prepare", help="Prepare test database as schema copy of development database")
-        db_console_parser = subparsers.add_parser("db", help="Open interactive database console (psql)")
+        if wants("db-create"):
+            db_create_parser = subparsers.add_parser("db-create", help="Create the PostgreSQL databases (development and test)")
+        if wants("db-migrate"):
+            db_migrate_parser = subparsers.add_parser("db-migrate", help="Run database migrations")
+        if wants("db-test-prepare"):
+            db_test_prepare_parser = subparsers.add_parser("db-test-prepare", help="Prepare test database as schema copy of development database")
+        if wants("db"):
+            db_console_parser = subparsers.add_parser("db", help="Open interactive database console (psql)")
         
         # Redis commands
-        redis_console_parser = subparsers.add_parser("redis", help="Open interactive Redis console (redis-cli)")
-        redis_ping_parser = subparsers.add_parser("redis-ping", help="Test Redis connection")
+        if wants("redis"):
+            redis_console_parser = subparsers.add_parser("redis", help="Open interactive Redis console (redis-cli)")
+        if wants("redis-ping"):
+            redis_ping_parser = subparsers.add_parser("redis-ping", help="Test Redis connection")
         
         # Version command
-        version_parser = subparsers.add_parser("version", help="Show Orbin version")
+        if wants("version"):
+            version_parser = subparsers.add_parser("version", help="Show Orbin version")
         
     else:
         # Outside app context - show framework commands
@@ -563,16 +626,23 @@ def main():
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
         
         # Create command
-        create_parser = subparsers.add_parser("create", help="Create a new Orbin application")
-        create_parser.add_argument("app_name", help="Name of the application to create")
-        create_parser.add_argument(
-            "--dir", 
-            help="Target directory (defaults to current directory)",
-            default=None
-        )
+        if wants("create"):
+            create_parser = subparsers.add_parser("create", help="Create a new Orbin application")
+            create_parser.add_argument("app_name", help="Name of the application to create")
+            create_parser.add_argument(
+                "--dir", 
+                help="Target directory (defaults to current directory)",
+                default=None
+            )
+            create_parser.add_argument(
+                "-v", "--verbose",
+                action="store_true",
+                help="List every file and directory as it is created"
+            )
         
         # Version command
-        version_parser = subparsers.add_parser("version", help="Show Orbin version")
+        if wants("version"):
+            version_parser = subparsers.add_parser("version", help="Show Orbin version")
     
     args = parser.parse_args()
     
@@ -580,7 +650,7 @@ def main():
         if in_app:
             print("❌ Error: Cannot create app from within an existing app directory")
             sys.exit(1)
-        create_app(args.app_name, args.dir)
+        create_app(args.app_name, args.dir, args.verbose)
     elif args.command in ["server", "s"]:
         start_server(args.bind, args.port)
     elif args.command in ["console", "c"]:
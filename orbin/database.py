@@ -7,16 +7,36 @@ Handles database creation, migration, and other database operations.
 import os
 import sys
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-import psycopg2
-from psycopg2 import sql
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+from urllib.parse import urlparse, urlunparse
+
+# psycopg2 is imported where it is used so importing this module stays cheap
+if TYPE_CHECKING:
+    from alembic.config import Config
+    from psycopg2.pool import ThreadedConnectionPool
+
+
+# Connection pools for the admin (postgres) database, keyed by admin URL
+_admin_pools: Dict[str, "ThreadedConnectionPool"] = {}
+
+
+def _get_admin_pool(admin_url: str) -> "ThreadedConnectionPool":
+    """Get the shared admin connection pool for a server, creating it on first use."""
+    pool = _admin_pools.get(admin_url)
+    if pool is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        pool = ThreadedConnectionPool(1, 4, admin_url)
+        _admin_pools[admin_url] = pool
+    return pool
 
 
 class DatabaseManager:
     """Manages database operations for Orbin applications."""
     
+    __slots__ = ("database_url", "parsed_url", "db_name", "test_mode", "_admin_url", "_alembic_config")
+    
     def __init__(self, database_url: Optional[str] = None, test_mode: bool = False):
         """
         Initialize database manager.
@@ -27,8 +47,8 @@ class DatabaseManager:
         """
         if database_url is None:
             # Load from environment (look for .env file in current directory)
-            from dotenv import load_dotenv
-            load_dotenv(Path.cwd() / ".env")
+            from ._env import load_env
+            load_env()
             
             if test_mode:
                 database_url = os.getenv("TEST_DATABASE_URL")
@@ -44,53 +64,72 @@ class DatabaseManager:
         self.db_name = self.parsed_url.path[1:]  # Remove leading slash
         self.test_mode = test_mode
         
-        # Create connection URL without database name for admin operations
-        self.admin_url = database_url.replace(f"/{self.db_name}", "/postgres")
+        # Admin URL and Alembic config are derived lazily on first use
+        self._admin_url: Optional[str] = None
+        self._alembic_config: Optional["Config"] = None
+    
+    @property
+    def admin_url(self) -> str:
+        """Connection URL for the postgres admin database on the same server."""
+        if self._admin_url is None:
+            self._admin_url = urlunparse(self.parsed_url._replace(path="/postgres"))
+        return self._admin_url
+    
+    @contextmanager
+    def _admin_cursor(self) -> Iterator[Any]:
+        """Yield an autocommit cursor on a pooled admin database connection."""
+        pool = _get_admin_pool(self.admin_url)
+        conn = pool.getconn()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                yield cursor
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+    
+    def _database_exists(self, cursor: Any) -> bool:
+        """Check if the database exists using an open admin cursor."""
+        cursor.execute(
+            "SELECT 1 FROM pg_database WHERE datname = %s",
+            (self.db_name,)
+        )
+        return cursor.fetchone() is not None
     
     def database_exists(self) -> bool:
         """Check if the database exists."""
         try:
-            conn = psycopg2.connect(self.admin_url)
-            conn.autocommit = True
-            cursor = conn.cursor()
-            
-            try:
-                cursor.execute(
-                    "SELECT 1 FROM pg_database WHERE datname = %s",
-                    (self.db_name,)
-                )
-                return cursor.fetchone() is not None
-            finally:
-                cursor.close()
-                conn.close()
+            with self._admin_cursor() as cursor:
+                return self._database_exists(cursor)
         except Exception as e:
             print(f"Error checking database existence: {e}")
             return False
     
-    def create_database(self):
-        """Create the PostgreSQL database if it doesn't exist."""
-        if self.database_exists():
-            print(f"✅ Database '{self.db_name}' already exists")
-            return True
+    def create_database(self, announce_existing: bool = True) -> bool:
+        """
+        Create the PostgreSQL database if it doesn't exist.
         
+        Args:
+            announce_existing: Whether to report a database that already exists.
+                Callers that only need the database to be there pass False.
+        """
         try:
-            print(f"🗃️  Creating database '{self.db_name}'...")
-            
-            # Connect without using context manager to avoid transactions
-            conn = psycopg2.connect(self.admin_url)
-            conn.autocommit = True
-            cursor = conn.cursor()
+            from psycopg2 import sql
             
-            try:
+            # Check and create on the same admin connection
+            with self._admin_cursor() as cursor:
+                if self._database_exists(cursor):
+                    if announce_existing:
+                        print(f"✅ Database '{self.db_name}' already exists")
+                    return True
+                
+                print(f"🗃️  Creating database '{self.db_name}'...")
+                
                 # Create database
                 cursor.execute(
                     sql.SQL("CREATE DATABASE {}").format(sql.Identifier(self.db_name))
                 )
                 print(f"✅ Successfully created database '{self.db_name}'")
                 return True
-            finally:
-                cursor.close()
-                conn.close()
             
         except Exception as e:
             print(f"❌ Error creating database: {e}")
@@ -98,19 +137,17 @@ class DatabaseManager:
     
     def drop_database(self):
         """Drop the PostgreSQL database if it exists."""
-        if not self.database_exists():
-            print(f"✅ Database '{self.db_name}' doesn't exist")
-            return True
-        
         try:
-            print(f"🗑️  Dropping database '{self.db_name}'...")
-            
-            # Connect without using context manager to avoid transactions
-            conn = psycopg2.connect(self.admin_url)
-            conn.autocommit = True
-            cursor = conn.cursor()
+            from psycopg2 import sql
             
-            try:
+            # Check and drop on the same admin connection
+            with self._admin_cursor() as cursor:
+                if not self._database_exists(cursor):
+                    print(f"✅ Database '{self.db_name}' doesn't exist")
+                    return True
+                
+                print(f"🗑️  Dropping database '{self.db_name}'...")
+                
                 # Terminate active connections to the database
                 cursor.execute(
                     sql.SQL("""
@@ -127,9 +164,6 @@ class DatabaseManager:
                 )
                 print(f"✅ Successfully dropped database '{self.db_name}'")
                 return True
-            finally:
-                cursor.close()
-                conn.close()
             
         except Exception as e:
             print(f"❌ Error dropping database: {e}")
@@ -156,9 +190,8 @@ class DatabaseManager:
                 print(f"❌ Error: Source database '{source_db_manager.db_name}' doesn't exist")
                 return False
             
-            if not self.database_exists():
-                if not self.create_database():
-                    return False
+            if not self.create_database(announce_existing=False):
+                return False
             
             # Use pg_dump to get schema only
             dump_command = [
@@ -220,7 +253,30 @@ class DatabaseManager:
                 print("❌ Error: alembic.ini not found. Run 'alembic init db/migrations' first.")
                 return False
             
-            # Run alembic upgrade
+            try:
+                from alembic import command
+            except ImportError:
+                return self._run_migrations_subprocess()
+            
+            # Run alembic upgrade in-process, avoiding a second interpreter start
+            command.upgrade(self._get_alembic_config(alembic_ini), "head")
+            print("✅ Migrations completed successfully")
+            return True
+                
+        except Exception as e:
+            print(f"❌ Error running migrations: {e}")
+            return False
+    
+    def _get_alembic_config(self, alembic_ini: Path) -> "Config":
+        """Return the Alembic config for alembic.ini, parsing it only once."""
+        if self._alembic_config is None:
+            from alembic.config import Config
+            self._alembic_config = Config(str(alembic_ini))
+        return self._alembic_config
+    
+    def _run_migrations_subprocess(self) -> bool:
+        """Run Alembic migrations through the alembic executable."""
+        try:
             result = subprocess.run(
                 ["alembic", "upgrade", "head"],
                 cwd=Path.cwd(),
@@ -275,11 +331,9 @@ def migrate_database():
     try:
         db_manager = DatabaseManager()
         
-        # First ensure database exists
-        if not db_manager.database_exists():
-            print("🗃️  Database doesn't exist, creating it first...")
-            if not db_manager.create_database():
-                return False
+        # First ensure database exists (checked and created in one round trip)
+        if not db_manager.create_database(announce_existing=False):
+            return False
         
         # Run migrations
         return db_manager.run_migrations()
@@ -4,7 +4,17 @@ Generators package for Orbin framework.
 Contains various generators for scaffolding applications, models, controllers, etc.
 """
 
-from .app_generator import AppGenerator
-from .controller_generator import ControllerGenerator
+from typing import Any
 
 __all__ = ['AppGenerator', 'ControllerGenerator']
+
+
+def __getattr__(name: str) -> Any:
+    """Import generators on first access so importing one doesn't load them all."""
+    if name == 'AppGenerator':
+        from .app_generator import AppGenerator
+        return AppGenerator
+    if name == 'ControllerGenerator':
+        from .controller_generator import ControllerGenerator
+        return ControllerGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,32 @@ Creates the initial application structure using Jinja2 templates.
 
 import os
 import sys
-import subprocess
-from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any
-import shutil
+from functools import lru_cache
+from typing import Optional, Deque, Dict, Any, List
 
 from .base_generator import BaseGenerator
 
 
+# Leaf directories of a new application, relative to the app root.
+# Parents (the app root, app/, db/, tests/) are created along with them.
+APP_DIRECTORIES = (
+    "app/routes",
+    "app/controllers",
+    "app/models",
+    "config",
+    "db/migrations/versions",
+    "tests/controllers",
+    "tests/fixtures",
+)
+
+
+@lru_cache(maxsize=None)
+def _venv_available() -> bool:
+    """Check (once per process) that this interpreter can build a venv with pip."""
+    import importlib.util
+    return all(importlib.util.find_spec(name) is not None for name in ("venv", "ensurepip"))
+
+
 class AppGenerator(BaseGenerator):
     """Generator for creating new Orbin applications using templates."""
     
@@ -32,17 +49,38 @@ class AppGenerator(BaseGenerator):
         
         self.app_name = app_name
         super().__init__(app_name, target_dir)
+        
+        # Prefer uv for the venv and install when it is on PATH (much faster than pip)
+        import shutil
+        self.uv_path = shutil.which("uv")
+        
+        # Virtual environment executables, resolved once
+        if os.name == 'nt':  # Windows
+            self.venv_bin = self.output_path / ".venv" / "Scripts"
+            exe_suffix = ".exe"
+        else:  # Unix/Linux/macOS
+            self.venv_bin = self.output_path / ".venv" / "bin"
+            exe_suffix = ""
+        self.venv_python = self.venv_bin / f"python{exe_suffix}"
+        self.venv_pip = self.venv_bin / f"pip{exe_suffix}"
     
     def _build_context(self) -> Dict[str, Any]:
         """Build the template context for app generation."""
+        from datetime import datetime
+        
+        # One clock read, so timestamp and year always agree
+        now = datetime.now()
         return {
             "app_name": self.app_name,
-            "timestamp": datetime.now().isoformat(),
-            "year": datetime.now().year,
+            "timestamp": now.isoformat(),
+            "year": now.year,
         }
     
     def generate(self):
         """Generate the complete application structure."""
+        import asyncio
+        import shutil
+        
         print(f"Creating Orbin application '{self.app_name}'...")
         
         # Check if directory already exists
@@ -50,18 +88,11 @@ class AppGenerator(BaseGenerator):
             print(f"Error: Directory '{self.output_path}' already exists!")
             sys.exit(1)
         
+        # Fail (or warn) before writing anything
+        create_venv = self._preflight()
+        
         try:
-            # Create directory structure
-            self._create_directory_structure()
-            
-            # Copy all template files
-            self._copy_template_files()
-            
-            # Set up virtual environment and install dependencies
-            self._setup_environment()
-            
-            # Set up database migrations
-            self._setup_database()
+            asyncio.run(self._generate_async(create_venv))
             
             # Print success message
             self._print_success_message()
@@ -73,66 +104,160 @@ class AppGenerator(BaseGenerator):
                 shutil.rmtree(self.output_path)
             sys.exit(1)
     
+    def _preflight(self) -> bool:
+        """
+        Check the environment before any files are written.
+        
+        Exits if the target directory is not writable.
+        
+        Returns:
+            True if a virtual environment can be created
+        """
+        # The target directory may not exist yet; check the nearest existing parent
+        target = self.target_dir.resolve()
+        while not target.exists() and target != target.parent:
+            target = target.parent
+        if not os.access(target, os.W_OK):
+            print(f"Error: Directory '{target}' is not writable!")
+            sys.exit(1)
+        
+        if self.uv_path or _venv_available():
+            return True
+        
+        print("⚠️  Warning: The venv/ensurepip modules are not available, skipping virtual environment setup.")
+        print("You can set it up manually later with:")
+        print(f"   cd {self.app_name}")
+        print("   python -m venv .venv")
+        print("   source .venv/bin/activate")
+        print("   pip install -r requirements.txt")
+        return False
+    
+    async def _generate_async(self, create_venv: bool = True) -> None:
+        """
+        Run the generation steps, overlapping subprocesses with file work.
+        
+        The venv is built while the templates are written (they touch disjoint
+        paths), and dependencies install while migrations are configured.
+        
+        Args:
+            create_venv: Whether to create the virtual environment and install dependencies
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        
+        # Create directory structure
+        self._create_directory_structure()
+        
+        if create_venv:
+            venv_task = asyncio.ensure_future(self._create_virtualenv())
+            try:
+                # Copy all template files
+                await loop.run_in_executor(None, self._copy_template_files)
+            finally:
+                # Never leave the venv subprocess running (e.g. before cleanup on failure)
+                venv_created = await venv_task
+        else:
+            await loop.run_in_executor(None, self._copy_template_files)
+            venv_created = False
+        
+        # Install dependencies (needs both the venv and requirements.txt)
+        install_task = None
+        if venv_created:
+            install_task = asyncio.ensure_future(self._install_dependencies())
+            # Let the install start before configuring migrations alongside it
+            await asyncio.sleep(0)
+        
+        # Set up database migrations
+        self._setup_database()
+        
+        if install_task is not None:
+            await install_task
+    
     def _create_directory_structure(self):
-        """Create the basic directory structure."""
-        directories = [
-            ".",
-            "app",
-            "app/routes", 
-            "app/controllers",
-            "app/models",
-            "config",
-            "db",
-            "db/migrations",
-            "tests",
-            "tests/controllers",
-            "tests/fixtures"
-        ]
-        
-        for directory in directories:
+        """Create the basic directory structure (every directory the templates write into)."""
+        for directory in APP_DIRECTORIES:
             self.create_directory(directory)
     
-    def _copy_template_files(self):
+    def _copy_template_files(self) -> None:
         """Copy and render all template files."""
         # Copy the entire app template directory
-        self.copy_template_directory("app")
+        written = self.copy_template_directory("app")
+        print(f"📄 Created {len(written)} files")
     
-    def _setup_environment(self):
-        """Set up Python virtual environment and install dependencies."""
-        print("🔧 Setting up virtual environment...")
+    async def _run_subprocess(self, command: List[str]) -> int:
+        """
+        Run a command in the app directory and wait for it without blocking the loop.
         
-        try:
-            # Create virtual environment
-            self.run_command(f"{sys.executable} -m venv .venv")
-            
-            # Determine the correct pip path
-            if os.name == 'nt':  # Windows
-                pip_path = self.output_path / ".venv" / "Scripts" / "pip"
-            else:  # Unix/Linux/macOS
-                pip_path = self.output_path / ".venv" / "bin" / "pip"
-            
-            print("📦 Installing dependencies...")
-            
-            # Install dependencies
-            install_result = subprocess.run(
-                [str(pip_path), "install", "-r", "requirements.txt"],
-                cwd=self.output_path,
-                capture_output=True,
-                text=True
-            )
-            
-            if install_result.returncode != 0:
-                print("⚠️  Warning: Some dependencies failed to install.")
-                print("You can install them manually later with:")
-                print(f"   cd {self.app_name}")
-                print("   source .venv/bin/activate")
-                print("   pip install -r requirements.txt")
+        Args:
+            command: Command and arguments
             
-        except subprocess.CalledProcessError:
-            print("⚠️  Warning: Virtual environment setup failed.")
-            print("You can set it up manually later with:")
+        Returns:
+            Process exit code
+        """
+        import asyncio
+        
+        process = await asyncio.create_subprocess_exec(*command, cwd=self.output_path)
+        return await process.wait()
+    
+    async def _create_virtualenv(self) -> bool:
+        """Create the Python virtual environment."""
+        print("🔧 Setting up virtual environment...")
+        
+        if self.uv_path:
+            # --seed installs pip into the venv, so the manual 'pip install' hints
+            # still target it (uv venvs have no pip otherwise)
+            command = [self.uv_path, "venv", "--seed", "--python", sys.executable, ".venv"]
+        else:
+            command = [sys.executable, "-m", "venv", ".venv"]
+        
+        if await self._run_subprocess(command) == 0:
+            return True
+        
+        print(f"⚠️  Warning: Command failed: {' '.join(command)}")
+        print("⚠️  Warning: Virtual environment setup failed.")
+        print("You can set it up manually later with:")
+        print(f"   cd {self.app_name}")
+        print("   python -m venv .venv")
+        print("   source .venv/bin/activate")
+        print("   pip install -r requirements.txt")
+        return False
+    
+    async def _install_dependencies(self) -> None:
+        """Install dependencies from requirements.txt into the virtual environment."""
+        import asyncio
+        from collections import deque
+        
+        if self.uv_path:
+            # uv resolves and unpacks in parallel and keeps a global wheel cache
+            install_command = [
+                self.uv_path, "pip", "install",
+                "--python", str(self.venv_python),
+                "-r", "requirements.txt"
+            ]
+        else:
+            install_command = [str(self.venv_pip), "install", "--no-input", "-r", "requirements.txt"]
+        
+        print("📦 Installing dependencies...")
+        
+        # Install dependencies, streaming output so only a short tail is kept in memory
+        output_tail: Deque[str] = deque(maxlen=40)
+        process = await asyncio.create_subprocess_exec(
+            *install_command,
+            cwd=self.output_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        assert process.stdout is not None  # opened with stdout=PIPE
+        async for line in process.stdout:
+            output_tail.append(line.decode('utf-8', 'replace'))
+        returncode = await process.wait()
+        
+        if returncode != 0:
+            print("⚠️  Warning: Some dependencies failed to install.")
+            print("".join(output_tail), end="")
+            print("You can install them manually later with:")
             print(f"   cd {self.app_name}")
-            print("   python -m venv .venv")
             print("   source .venv/bin/activate")
             print("   pip install -r requirements.txt")
     
@@ -2,13 +2,108 @@
 Base generator class for template-based code generation.
 """
 
+import logging
 import os
-import sys
-import subprocess
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-import shutil
-from jinja2 import Environment, FileSystemLoader, Template
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Set, Tuple, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+# subprocess is only needed by run_command, so it is imported there
+if TYPE_CHECKING:
+    import subprocess
+
+# Per-file progress goes here; enable with 'orbin create --verbose'
+logger = logging.getLogger("orbin.generator")
+
+
+# Any of these markers means a template file needs a real Jinja render
+_JINJA_SYNTAX_RE = re.compile(rb'\{[{%#]')
+
+# Flags for writing generated files; O_BINARY keeps Windows from translating newlines
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Get a Jinja bytecode cache in the user cache directory.
+    
+    Compiled templates are reused across orbin invocations. Returns None
+    (templates are just compiled in memory) if the directory can't be created.
+    """
+    if os.name == 'nt':
+        cache_root = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    else:
+        cache_root = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    
+    cache_dir = Path(cache_root) / "orbin" / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
+
+
+@lru_cache(maxsize=None)
+def _get_jinja_env(templates_dir: str) -> Environment:
+    """
+    Get the Jinja2 environment for a templates directory, shared by all generators.
+    
+    Templates loaded by one generator stay compiled for every later generator
+    in the same process, on top of the bytecode cache kept between runs.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates don't change during a run: skip mtime checks, never evict
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_get_bytecode_cache()
+    )
+
+
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    """Write bytes to a file with a raw fd, without a text-layer buffer or codec lookup."""
+    fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_output(file_path: Path, data: Union[bytes, Path]) -> None:
+    """
+    Write rendered bytes to file_path, or copy the file data points to there.
+    
+    Copies are passed as Path objects, never str, so rendered text can't be
+    mistaken for a source path.
+    """
+    if isinstance(data, Path):
+        import shutil
+        shutil.copyfile(data, file_path)
+    elif isinstance(data, bytes):
+        _write_bytes(file_path, data)
+    else:
+        raise TypeError(f"Expected bytes or a source Path, got {type(data).__name__}")
+
+
+def _walk_template_files(root: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    Yield (relative posix path, absolute path) for every file under root.
+    
+    Uses os.scandir directly so file/dir checks come from the cached directory
+    entries instead of an extra stat per child.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_template_files(entry.path, prefix + entry.name + "/")
+            elif entry.is_file():
+                yield prefix + entry.name, entry.path
 
 
 class BaseGenerator:
@@ -26,13 +121,12 @@ class BaseGenerator:
         self.target_dir = Path(target_dir) if target_dir else Path.cwd()
         self.output_path = self.target_dir / name
         
-        # Set up Jinja2 environment
+        # Directories known to exist, so each one is created at most once
+        self._created_dirs: Set[Path] = set()
+        
+        # Set up Jinja2 environment (shared, so compiled templates are reused)
         self.templates_dir = Path(__file__).parent.parent / "templates"
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.jinja_env = _get_jinja_env(str(self.templates_dir))
         
         # Template context - override in subclasses
         self.context = self._build_context()
@@ -79,21 +173,21 @@ class BaseGenerator:
         template = Template(template_string)
         return template.render(**merged_context)
     
-    def write_file(self, relative_path: str, content: str):
+    def write_file(self, relative_path: str, content: Union[str, bytes]) -> None:
         """
         Write content to a file relative to the output path.
         
         Args:
             relative_path: Path relative to the output directory
-            content: Content to write
+            content: Content to write (str is encoded as UTF-8, bytes are written as-is)
         """
         file_path = self.output_path / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(file_path.parent)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        _write_bytes(file_path, data)
         
-        print(f"📄 Created file: {relative_path}")
+        logger.debug("📄 Created file: %s", relative_path)
     
     def copy_template_file(self, template_path: str, output_path: str, context: Optional[Dict[str, Any]] = None):
         """
@@ -112,37 +206,67 @@ class BaseGenerator:
         
         self.write_file(output_path, content)
     
-    def copy_template_directory(self, template_dir: str, output_dir: str = "", context: Optional[Dict[str, Any]] = None):
+    def copy_template_directory(self, template_dir: str, output_dir: str = "", context: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Copy and render all template files from a directory.
         
+        .j2 files are rendered (dropping the extension); any other file, such
+        as Alembic's script.py.mako, is copied verbatim.
+        
         Args:
             template_dir: Template directory path (relative to templates directory)
             output_dir: Output directory path (relative to output directory)
             context: Additional context for rendering
+            
+        Returns:
+            Output paths of the files written (relative to output directory)
         """
         template_path = self.templates_dir / template_dir
         
         if not template_path.exists():
             raise ValueError(f"Template directory not found: {template_path}")
         
-        for root, dirs, files in os.walk(template_path):
-            root_path = Path(root)
-            relative_root = root_path.relative_to(template_path)
+        # Render everything on this thread; only the independent file writes are parallel
+        pending = []
+        for relative_file, source_path in _walk_template_files(str(template_path)):
+            template_file_path = template_dir + "/" + relative_file
+            is_template = relative_file.endswith('.j2')
+            
+            # Remove .j2 extension from output path
+            output_file_path = relative_file[:-3] if is_template else relative_file
             
-            for file in files:
-                if file.endswith('.j2'):
-                    template_file_path = template_dir + "/" + str(relative_root / file).replace("\\", "/")
-                    output_file_path = str(relative_root / file)
-                    
-                    # Remove .j2 extension from output path
-                    if output_file_path.endswith('.j2'):
-                        output_file_path = output_file_path[:-3]
-                    
-                    if output_dir:
-                        output_file_path = output_dir + "/" + output_file_path
-                    
-                    self.copy_template_file(template_file_path, output_file_path, context)
+            if output_dir:
+                output_file_path = output_dir + "/" + output_file_path
+            
+            if not is_template:
+                # Plain files are copied file-to-file (sendfile where available), never read here
+                data: Union[bytes, Path] = Path(source_path)
+            else:
+                # Files without Jinja syntax are written as-is, skipping parse/compile
+                with open(source_path, 'rb') as f:
+                    source = f.read()
+                if not _JINJA_SYNTAX_RE.search(source):
+                    # Match Jinja's default of dropping a single trailing newline
+                    if source.endswith(b'\n'):
+                        source = source[:-1]
+                    data = source
+                else:
+                    data = self.render_template(template_file_path, context).encode('utf-8')
+            
+            file_path = self.output_path / output_file_path
+            self._ensure_directory(file_path.parent)
+            pending.append((output_file_path, file_path, data))
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # list() re-raises the first write error, if any
+            list(executor.map(lambda item: _write_output(item[1], item[2]), pending))
+        
+        written = [output_file_path for output_file_path, _, _ in pending]
+        for output_file_path in written:
+            logger.debug("📄 Created file: %s", output_file_path)
+        return written
     
     def create_directory(self, relative_path: str):
         """
@@ -152,10 +276,26 @@ class BaseGenerator:
             relative_path: Directory path relative to output directory
         """
         dir_path = self.output_path / relative_path
+        self._ensure_directory(dir_path)
+        logger.debug("📁 Created directory: %s", relative_path)
+    
+    def _ensure_directory(self, dir_path: Path) -> None:
+        """
+        Create a directory (and its parents) unless it was already created.
+        
+        Args:
+            dir_path: Absolute directory path
+        """
+        if dir_path in self._created_dirs:
+            return
+        
         dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"📁 Created directory: {relative_path}")
+        
+        # mkdir(parents=True) also guarantees every ancestor exists
+        self._created_dirs.add(dir_path)
+        self._created_dirs.update(dir_path.parents)
     
-    def run_command(self, command: str, cwd: Optional[Path] = None, capture_output: bool = False) -> subprocess.CompletedProcess:
+    def run_command(self, command: str, cwd: Optional[Path] = None, capture_output: bool = False) -> "subprocess.CompletedProcess":
         """
         Run a shell command.
         
@@ -167,6 +307,8 @@ class BaseGenerator:
         Returns:
             CompletedProcess result
         """
+        import subprocess
+        
         if cwd is None:
             cwd = self.output_path
         
@@ -163,9 +163,15 @@ class ControllerGenerator(BaseGenerator):
         rest_actions = {'index', 'show', 'create', 'update', 'destroy'}
         custom_actions = [action for action in self.actions if action['name'] not in rest_actions]
         
+        # Names the template repeats many times, derived once here
+        singular_name = self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name
+        schema_name = self.class_name.replace('Controller', '')
+        
         return {
             "controller_name": self.controller_name,
             "class_name": self.class_name,
+            "singular_name": singular_name,
+            "schema_name": schema_name,
             "route_prefix": self.route_prefix,
             "actions": self.actions,
             "has_index": has_index,
@@ -235,8 +241,9 @@ class ControllerGenerator(BaseGenerator):
         if not controllers_init_path.exists():
             # Create basic __init__.py if it doesn't exist
             content = f'"""Controllers package."""\n\nfrom .{self.controller_name}_controller import {self.class_name}\n\n__all__ = [\'{self.class_name}\']\n'
+            original = None
         else:
-            content = controllers_init_path.read_text()
+            content = original = controllers_init_path.read_text()
         
         # Check if import already exists
         import_line = f"from .{self.controller_name}_controller import {self.class_name}"
@@ -263,12 +270,14 @@ class ControllerGenerator(BaseGenerator):
                             new_all = f"__all__ = [{current_controllers}, '{self.class_name}']"
                         else:
                             new_all = f"__all__ = ['{self.class_name}']"
-                        content = re.sub(r"__all__ = \[.*?\]", new_all, content, flags=re.DOTALL)
+                        # Splice at the match found above instead of searching again with re.sub
+                        content = content[:import_match.start()] + new_all + content[import_match.end():]
             else:
                 # Add __all__ list
                 content += f"\n__all__ = ['{self.class_name}']\n"
-            
-            # Write updated content
+        
+        # Write only when the file is new or actually changed
+        if content != original:
             controllers_init_path.write_text(content)
             print(f"📄 Updated: app/controllers/__init__.py")
     
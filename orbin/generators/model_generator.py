@@ -219,8 +219,9 @@ class ModelGenerator(BaseGenerator):
         if not models_init_path.exists():
             # Create basic __init__.py if it doesn't exist
             content = f'"""Models package."""\n\nfrom .{self.model_name} import {self.class_name}\n\n__all__ = [\'{self.class_name}\']\n'
+            original = None
         else:
-            content = models_init_path.read_text()
+            content = original = models_init_path.read_text()
         
         # Check if import already exists
         import_line = f"from .{self.model_name} import {self.class_name}"
@@ -247,11 +248,13 @@ class ModelGenerator(BaseGenerator):
                             new_all = f"__all__ = [{current_models}, '{self.class_name}']"
                         else:
                             new_all = f"__all__ = ['{self.class_name}']"
-                        content = re.sub(r"__all__ = \[.*?\]", new_all, content, flags=re.DOTALL)
+                        # Splice at the match found above instead of searching again with re.sub
+                        content = content[:import_match.start()] + new_all + content[import_match.end():]
             else:
                 # Add __all__ list
                 content += f"\n__all__ = ['{self.class_name}']\n"
-            
-            # Write updated content
+        
+        # Write only when the file is new or actually changed
+        if content != original:
             models_init_path.write_text(content)
             print(f"📄 Updated: app/models/__init__.py")
@@ -4,29 +4,153 @@ Resource Generator for Orbin framework.
 Creates RESTful controllers for existing models with standard CRUD operations.
 """
 
+import ast
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 import inflect
 
 from .base_generator import BaseGenerator
-from .controller_generator import ControllerGenerator
+
+
+# Shared inflect engine; singular_noun/plural don't mutate it, so one serves every instance
+_INFLECT_ENGINE = inflect.engine()
+
+# Characters stripped from model names before inflection
+_CLEAN_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+
+# Standard columns every model has, left out of generated schemas and tests
+_SKIP_COLUMNS = frozenset({'id', 'created_at', 'updated_at'})
+
+# SQLAlchemy column types mapped to Pydantic field types
+_PYDANTIC_TYPES: Mapping[str, str] = MappingProxyType({
+    'String': 'str',
+    'Integer': 'int',
+    'Float': 'float',
+    'Boolean': 'bool',
+    'Text': 'str',
+    'DateTime': 'str',  # We'll use ISO strings
+    'Date': 'str',
+    'Time': 'str',
+    'JSON': 'dict',
+    'Numeric': 'float',
+})
+
+# Test values per column type, used when creating records
+_TYPE_TEST_VALUES: Mapping[str, str] = MappingProxyType({
+    'String': '"test_value"',
+    'Integer': '42',
+    'Float': '12.34',
+    'Boolean': 'True',
+    'Text': '"test_text_content"',
+    'DateTime': '"2023-01-01T12:00:00"',
+    'Date': '"2023-01-01"',
+    'Time': '"12:00:00"',
+    'JSON': '{"key": "value"}',
+    'Numeric': '99.99',
+})
+
+# Alternative test values per column type, used for updates
+_TYPE_ALT_TEST_VALUES: Mapping[str, str] = MappingProxyType({
+    'String': '"updated_value"',
+    'Integer': '84',
+    'Float': '56.78',
+    'Boolean': 'False',
+    'Text': '"updated_text_content"',
+    'DateTime': '"2023-12-31T12:00:00"',
+    'Date': '"2023-12-31"',
+    'Time': '"18:00:00"',
+    'JSON': '{"updated": "value"}',
+    'Numeric': '199.99',
+})
+
+
+# Name transforms are pure, so results are memoized across generator instances
+
+@lru_cache(maxsize=512)
+def _singularize(name: str) -> str:
+    """Clean a model name and convert it to singular form."""
+    # Remove non-alphanumeric characters except underscores
+    clean_name = _CLEAN_RE.sub('', name.lower())
+    
+    # Singularize using inflect
+    singular = _INFLECT_ENGINE.singular_noun(clean_name)
+    return singular if singular else clean_name
+
+
+@lru_cache(maxsize=512)
+def _pluralize(name: str) -> str:
+    """Convert a model name to plural form."""
+    return _INFLECT_ENGINE.plural(name)
+
+
+@lru_cache(maxsize=512)
+def _to_class_name(name: str) -> str:
+    """Convert a model name to a PascalCase class name."""
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    """Return the bare name of a Name or Attribute node (e.g. "String" for sa.String)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _iter_columns(tree: ast.AST) -> Iterator[Tuple[str, str, ast.Call]]:
+    """
+    Yield (name, type name, Column call) for each Column assignment in a parsed model.
+    
+    Handles plain and annotated assignments (name = Column(...) and
+    name: str = Column(...)), bare and called types (String, String(255),
+    sa.String) and Column definitions spread over several lines.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        elif isinstance(node, ast.AnnAssign):
+            target = node.target
+        else:
+            continue
+        
+        call = node.value
+        if not (isinstance(target, ast.Name) and isinstance(call, ast.Call)
+                and _call_name(call.func) == 'Column'):
+            continue
+        
+        # The type is the first positional argument that isn't a column name string
+        for arg in call.args:
+            if isinstance(arg, ast.Constant):
+                continue
+            type_name = _call_name(arg.func if isinstance(arg, ast.Call) else arg)
+            if type_name:
+                yield target.id, type_name, call
+            break
 
 
 class ResourceGenerator(BaseGenerator):
     """Generator for creating RESTful controllers for existing models."""
     
-    def __init__(self, model_name: str, target_dir: Optional[str] = None):
+    def __init__(self, model_name: str, target_dir: Optional[str] = None, verbose: bool = True):
         """
         Initialize the resource generator.
         
         Args:
             model_name: Name of the existing model (e.g., "User", "Post")
             target_dir: Target directory (defaults to current directory)
+            verbose: Whether to print the summary of generated files and routes
         """
-        # Initialize inflect engine for pluralization
-        self.inflect_engine = inflect.engine()
+        self.verbose = verbose
+        
+        # Inflect engine for pluralization
+        self.inflect_engine = _INFLECT_ENGINE
         
         # Process model name
         self.model_name = self._singularize_model_name(model_name)
@@ -40,38 +164,48 @@ class ResourceGenerator(BaseGenerator):
         
         # Override output path to current directory, not model subdirectory
         self.output_path = self.target_dir
+        
+        # Paths inside the existing app, resolved once (model_name is fixed from here on)
+        app_dir = Path.cwd() / "app"
+        self._model_file = app_dir / "models" / f"{self.model_name}.py"
+        
+        # Model file contents, read once by _check_model_exists
+        self._model_source: Optional[bytes] = None
     
     def _singularize_model_name(self, name: str) -> str:
         """Convert model name to singular form."""
-        # Remove non-alphanumeric characters except underscores
-        clean_name = re.sub(r'[^a-zA-Z0-9_]', '', name.lower())
-        
-        # Singularize using inflect
-        singular = self.inflect_engine.singular_noun(clean_name)
-        return singular if singular else clean_name
+        return _singularize(name)
     
     def _pluralize_model_name(self, name: str) -> str:
         """Convert model name to plural form for controller name."""
-        return self.inflect_engine.plural(name)
+        return _pluralize(name)
     
     def _to_class_name(self, name: str) -> str:
         """Convert model name to PascalCase class name."""
-        return ''.join(word.capitalize() for word in name.split('_'))
+        return _to_class_name(name)
     
     def _check_model_exists(self) -> bool:
-        """Check if the model file exists."""
-        model_file = Path.cwd() / "app" / "models" / f"{self.model_name}.py"
-        return model_file.exists()
+        """Check if the model file exists, reading it in the same step."""
+        try:
+            self._model_source = self._model_file.read_bytes()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # It exists but can't be read; _extract_model_attributes reports that
+            pass
+        return True
     
     def _build_context(self) -> Dict[str, Any]:
         """Build the template context for resource generation."""
+        # One clock read, so timestamp and year always agree
+        now = datetime.now()
         return {
             "model_name": self.model_name,
             "class_name": self.class_name,
             "controller_name": self.controller_name,
             "actions": self.actions,
-            "timestamp": datetime.now().isoformat(),
-            "year": datetime.now().year,
+            "timestamp": now.isoformat(),
+            "year": now.year,
         }
     
     def generate(self):
@@ -97,8 +231,9 @@ class ResourceGenerator(BaseGenerator):
                 "route_prefix": f"/{self.controller_name}",
                 "actions": self.actions,
                 "model_attributes": model_attributes,
-                "timestamp": datetime.now().isoformat(),
-                "year": datetime.now().year,
+                # Reuse the generator's clock read instead of taking new ones
+                "timestamp": self.context["timestamp"],
+                "year": self.context["year"],
             }
             
             # Generate controller using resource-specific template
@@ -116,23 +251,28 @@ class ResourceGenerator(BaseGenerator):
             # Add route to routes/__init__.py
             self.add_route_to_app(self.controller_name, self.controller_name)
             
-            print(f"✅ Successfully generated RESTful controller for '{self.class_name}' model!")
-            print(f"📄 Controller file: {controller_file}")
-            print(f"� Test file: {test_file}")
-            print(f"📄 Fixtures file: {fixtures_file}")
-            print()
-            print("🛣️  Generated routes:")
-            print(f"   GET    /{self.controller_name}                      → index()")
-            print(f"   GET    /{self.controller_name}/{{id}}                 → show()")
-            print(f"   POST   /{self.controller_name}                      → create()")
-            print(f"   PUT    /{self.controller_name}/{{id}}                 → update()")
-            print(f"   DELETE /{self.controller_name}/{{id}}                 → destroy()")
-            print()
-            print("🚀 Next steps:")
-            print("   1. Review and customize the generated controller")
-            print("   2. Update Pydantic schemas as needed")
-            print("   3. Run tests: orbin test")
-            print("   4. Start the server: orbin server")
+            if self.verbose:
+                # Emit the summary in a single write rather than one print per line
+                lines = [
+                    f"✅ Successfully generated RESTful controller for '{self.class_name}' model!",
+                    f"📄 Controller file: {controller_file}",
+                    f"📄 Test file: {test_file}",
+                    f"📄 Fixtures file: {fixtures_file}",
+                    "",
+                    "🛣️  Generated routes:",
+                    f"   GET    /{self.controller_name}                      → index()",
+                    f"   GET    /{self.controller_name}/{{id}}                 → show()",
+                    f"   POST   /{self.controller_name}                      → create()",
+                    f"   PUT    /{self.controller_name}/{{id}}                 → update()",
+                    f"   DELETE /{self.controller_name}/{{id}}                 → destroy()",
+                    "",
+                    "🚀 Next steps:",
+                    "   1. Review and customize the generated controller",
+                    "   2. Update Pydantic schemas as needed",
+                    "   3. Run tests: orbin test",
+                    "   4. Start the server: orbin server",
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
             
             return True
             
@@ -140,119 +280,22 @@ class ResourceGenerator(BaseGenerator):
             print(f"❌ Error generating resource: {e}")
             raise
     
-    def _update_controller_for_model(self):
-        """Update the generated controller to include model-specific imports and schemas."""
-        controller_file = Path.cwd() / "app" / "controllers" / f"{self.controller_name}_controller.py"
-        
-        if not controller_file.exists():
-            return
-        
-        content = controller_file.read_text()
-        
-        # Add model import
-        model_import = f"from app.models.{self.model_name} import {self.class_name}"
-        
-        # Find the config.database import line and add model import after it
-        if "from config.database import get_db" in content and model_import not in content:
-            content = content.replace(
-                "from config.database import get_db",
-                f"from config.database import get_db\n{model_import}"
-            )
-        
-        # Update schema class names to match the model
-        content = content.replace(
-            f"class {self.controller_name.title()}Base(BaseModel):",
-            f"class {self.class_name}Base(BaseModel):"
-        )
-        content = content.replace(
-            f"class {self.controller_name.title()}Create({self.controller_name.title()}Base):",
-            f"class {self.class_name}Create({self.class_name}Base):"
-        )
-        content = content.replace(
-            f"class {self.controller_name.title()}Update({self.controller_name.title()}Base):",
-            f"class {self.class_name}Update({self.class_name}Base):"
-        )
-        content = content.replace(
-            f"class {self.controller_name.title()}Response({self.controller_name.title()}Base):",
-            f"class {self.class_name}Response({self.class_name}Base):"
-        )
-        
-        # Update TODO comments with actual model references
-        content = content.replace(
-            f"# TODO: Implement logic to fetch all {self.controller_name}",
-            f"# TODO: Implement logic to fetch all {self.controller_name}\n        # Example:\n        # {self.controller_name} = db.query({self.class_name}).all()\n        # return {self.controller_name}"
-        )
-        
-        content = content.replace(
-            f"# TODO: Implement logic to fetch {self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name} by ID",
-            f"# TODO: Implement logic to fetch {self.model_name} by ID\n        # Example:\n        # {self.model_name} = db.query({self.class_name}).filter({self.class_name}.id == id).first()\n        # if not {self.model_name}:\n        #     raise HTTPException(status_code=404, detail=\"{self.class_name} not found\")\n        # return {self.model_name}"
-        )
-        
-        content = content.replace(
-            f"# TODO: Implement logic to create new {self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name}",
-            f"# TODO: Implement logic to create new {self.model_name}\n        # Example:\n        # {self.model_name} = {self.class_name}(**{self.model_name}_data.dict())\n        # db.add({self.model_name})\n        # db.commit()\n        # db.refresh({self.model_name})\n        # return {self.model_name}"
-        )
-        
-        content = content.replace(
-            f"# TODO: Implement logic to update {self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name}",
-            f"# TODO: Implement logic to update {self.model_name}\n        # Example:\n        # {self.model_name} = db.query({self.class_name}).filter({self.class_name}.id == id).first()\n        # if not {self.model_name}:\n        #     raise HTTPException(status_code=404, detail=\"{self.class_name} not found\")\n        # for key, value in {self.model_name}_data.dict(exclude_unset=True).items():\n        #     setattr({self.model_name}, key, value)\n        # db.commit()\n        # return {self.model_name}"
-        )
-        
-        content = content.replace(
-            f"# TODO: Implement logic to delete {self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name}",
-            f"# TODO: Implement logic to delete {self.model_name}\n        # Example:\n        # {self.model_name} = db.query({self.class_name}).filter({self.class_name}.id == id).first()\n        # if not {self.model_name}:\n        #     raise HTTPException(status_code=404, detail=\"{self.class_name} not found\")\n        # db.delete({self.model_name})\n        # db.commit()\n        # return {{\"message\": \"{self.class_name} deleted successfully\"}}"
-        )
-        
-        # Update parameter names in function signatures
-        content = content.replace(
-            f"{self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name}_data: {self.class_name}Create",
-            f"{self.model_name}_data: {self.class_name}Create"
-        )
-        content = content.replace(
-            f"{self.controller_name[:-1] if self.controller_name.endswith('s') else self.controller_name}_data: {self.class_name}Update",
-            f"{self.model_name}_data: {self.class_name}Update"
-        )
-        
-        # Fix return type annotations to use correct schema names
-        # The controller template uses pluralized names like UsersResponse, but we want UserResponse
-        old_response_name = self.controller_name.title() + 'Response'  # UsersResponse
-        new_response_name = f"{self.class_name}Response"  # UserResponse
-        
-        content = content.replace(f"-> List[{old_response_name}]:", f"-> List[{new_response_name}]:")
-        content = content.replace(f"-> {old_response_name}:", f"-> {new_response_name}:")
-        
-        # Fix parameter type annotations
-        old_create_name = self.controller_name.title() + 'Create'  # UsersCreate
-        old_update_name = self.controller_name.title() + 'Update'  # UsersUpdate
-        
-        content = content.replace(f": {old_create_name},", f": {self.class_name}Create,")
-        content = content.replace(f": {old_update_name},", f": {self.class_name}Update,")
-        
-        # Write the updated content
-        controller_file.write_text(content)
-        print(f"📄 Updated controller with {self.class_name} model integration")
-    
-    def _extract_model_attributes(self):
+    def _extract_model_attributes(self) -> List[Dict[str, Any]]:
         """Extract attributes from the existing model file for template generation."""
-        model_file = Path.cwd() / "app" / "models" / f"{self.model_name}.py"
-        
-        if not model_file.exists():
-            return []
-        
         try:
-            content = model_file.read_text()
+            # Reuse the source read by _check_model_exists when available
+            source = self._model_source
+            if source is None:
+                source = self._model_file.read_bytes()
+            tree = ast.parse(source)
             attributes = []
             
-            # Enhanced regex to find Column definitions with better type extraction
-            import re
-            column_pattern = r'(\w+)\s*=\s*Column\((\w+)(?:\(([^)]*)\))?'
-            matches = re.findall(column_pattern, content)
-            
-            for match in matches:
-                attr_name, attr_type, attr_params = match
+            # Walk Column definitions with their type and keyword arguments
+            for attr_name, attr_type, column in _iter_columns(tree):
                 # Skip standard fields
-                if attr_name in ['id', 'created_at', 'updated_at']:
+                if attr_name in _SKIP_COLUMNS:
                     continue
+                nullable = next((kw.value for kw in column.keywords if kw.arg == 'nullable'), None)
                 
                 # Get type info
                 pydantic_type = self._get_pydantic_type(attr_type)
@@ -260,7 +303,10 @@ class ResourceGenerator(BaseGenerator):
                 test_value_alt = self._get_alt_test_value_for_type(attr_type)
                 
                 # Check if required (nullable=False or no nullable specified)
-                is_required = 'nullable=False' in attr_params or ('nullable' not in attr_params and attr_type != 'Text')
+                if nullable is None:
+                    is_required = attr_type != 'Text'
+                else:
+                    is_required = isinstance(nullable, ast.Constant) and nullable.value is False
                 
                 attributes.append({
                     'name': attr_name,
@@ -273,57 +319,23 @@ class ResourceGenerator(BaseGenerator):
                 })
             
             return attributes
+        except FileNotFoundError:
+            return []
         except Exception as e:
             print(f"⚠️  Warning: Could not extract model attributes: {e}")
             return []
     
     def _get_pydantic_type(self, sql_type: str) -> str:
         """Map SQLAlchemy types to Pydantic types."""
-        type_mapping = {
-            'String': 'str',
-            'Integer': 'int',
-            'Float': 'float',
-            'Boolean': 'bool',
-            'Text': 'str',
-            'DateTime': 'str',  # We'll use ISO strings
-            'Date': 'str',
-            'Time': 'str',
-            'JSON': 'dict',
-            'Numeric': 'float',
-        }
-        return type_mapping.get(sql_type, 'str')
+        return _PYDANTIC_TYPES.get(sql_type, 'str')
     
     def _get_test_value_for_type(self, attr_type: str) -> str:
         """Get appropriate test value for attribute type."""
-        type_mapping = {
-            'String': '"test_value"',
-            'Integer': '42',
-            'Float': '12.34',
-            'Boolean': 'True',
-            'Text': '"test_text_content"',
-            'DateTime': '"2023-01-01T12:00:00"',
-            'Date': '"2023-01-01"',
-            'Time': '"12:00:00"',
-            'JSON': '{"key": "value"}',
-            'Numeric': '99.99',
-        }
-        return type_mapping.get(attr_type, '"test_value"')
+        return _TYPE_TEST_VALUES.get(attr_type, '"test_value"')
     
     def _get_alt_test_value_for_type(self, attr_type: str) -> str:
         """Get alternative test value for updates."""
-        type_mapping = {
-            'String': '"updated_value"',
-            'Integer': '84',
-            'Float': '56.78',
-            'Boolean': 'False',
-            'Text': '"updated_text_content"',
-            'DateTime': '"2023-12-31T12:00:00"',
-            'Date': '"2023-12-31"',
-            'Time': '"18:00:00"',
-            'JSON': '{"updated": "value"}',
-            'Numeric': '199.99',
-        }
-        return type_mapping.get(attr_type, '"updated_value"')
+        return _TYPE_ALT_TEST_VALUES.get(attr_type, '"updated_value"')
     
     def _get_fixture_value(self, base_value: str, index: int) -> str:
         """Generate fixture values with variations."""
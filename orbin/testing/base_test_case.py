@@ -13,10 +13,10 @@ import yaml
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
 from typing import Generator, Dict, Any
 
 from config.database import get_db, Base
+from orbin._env import load_env
 
 
 class BaseTestCase:
@@ -26,7 +26,7 @@ class BaseTestCase:
     def setup_class(cls):
         """Set up class-level test configuration."""
         # Load environment variables
-        load_dotenv()
+        load_env()
         
         # Get test database URL
         cls.test_database_url = os.getenv("TEST_DATABASE_URL")
@@ -0,0 +1,79 @@
+"""
+Tests for the ModelMixin helpers in the generated config/database.py.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+TEMPLATE = Path(__file__).parent.parent / "orbin" / "templates" / "app" / "config" / "database.py.j2"
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Import the generated config.database module against an in-memory SQLite database."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "__init__.py").write_text("")
+    (config_dir / "settings.py").write_text(
+        "class Settings:\n    DATABASE_URL = 'sqlite://'\n\n\nsettings = Settings()\n"
+    )
+    shutil.copyfile(TEMPLATE, config_dir / "database.py")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    import config.database
+    yield config.database
+
+    for name in [name for name in sys.modules if name == "config" or name.startswith("config.")]:
+        del sys.modules[name]
+
+
+class TestModelMixinToDict:
+    """Test cases for ModelMixin.to_dict."""
+
+    def test_override_survives_repeated_calls(self, database):
+        """Test a model extending to_dict keeps its extra keys after the first call."""
+        from sqlalchemy import Column, Integer, String
+
+        class Post(database.Base):
+            __tablename__ = "posts"
+            id = Column(Integer, primary_key=True)
+            title = Column(String)
+
+            def to_dict(self):
+                d = super().to_dict()
+                d["extra"] = 1
+                return d
+
+        post = Post(title="a")
+        expected = {"id": None, "title": "a", "extra": 1}
+        assert post.to_dict() == expected
+        assert post.to_dict() == expected
+        assert Post(title="b").to_dict()["extra"] == 1
+
+
+class TestModelMixinRowsAsDicts:
+    """Test cases for ModelMixin.rows_as_dicts."""
+
+    def test_keys_match_to_dict(self, database):
+        """Test rows use attribute keys, like to_dict, for a renamed column."""
+        from sqlalchemy import Column, Integer, String
+        from sqlalchemy.orm import Session
+
+        class Article(database.Base):
+            __tablename__ = "articles"
+            id = Column(Integer, primary_key=True)
+            title = Column(String)
+            views = Column("view_count", Integer)
+
+        database.Base.metadata.create_all(database.engine)
+        with Session(database.engine) as session:
+            article = Article(title="a", views=3)
+            session.add(article)
+            session.commit()
+
+            rows = list(Article.rows_as_dicts(session))
+            assert rows == [{"id": 1, "title": "a", "views": 3}]
+            assert set(rows[0]) == set(article.to_dict())
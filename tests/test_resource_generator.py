@@ -0,0 +1,82 @@
+"""
+Tests for the resource generator's model attribute extraction.
+"""
+
+import pytest
+
+from orbin.generators.resource_generator import ResourceGenerator
+
+
+MODEL_SOURCE = '''
+import uuid
+import sqlalchemy as sa
+from sqlalchemy import Column, String, Integer, Text, UUID
+from config.database import Base
+
+
+class Post(Base):
+    """Post model."""
+
+    __tablename__ = "posts"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    title = Column(String(255), nullable=False)
+    body = Column(
+        Text,
+        nullable=False,
+    )
+    summary = sa.Column(sa.Text)
+    views = Column("view_count", Integer, nullable=True)
+    slug: str = Column(String)
+
+    def to_dict(self):
+        return {'id': str(self.id)}
+'''
+
+
+@pytest.fixture
+def attributes(tmp_path, monkeypatch):
+    """Extract the attributes of MODEL_SOURCE written as app/models/post.py."""
+    models_dir = tmp_path / "app" / "models"
+    models_dir.mkdir(parents=True)
+    (models_dir / "post.py").write_text(MODEL_SOURCE)
+    monkeypatch.chdir(tmp_path)
+
+    generator = ResourceGenerator("post")
+    return {attr['name']: attr for attr in generator._extract_model_attributes()}
+
+
+class TestExtractModelAttributes:
+    """Test cases for ResourceGenerator._extract_model_attributes."""
+
+    def test_standard_columns_skipped(self, attributes):
+        """Test id and timestamp columns are left out."""
+        assert 'id' not in attributes
+        assert list(attributes) == ['title', 'body', 'summary', 'views', 'slug']
+
+    def test_called_type_with_nullable_false(self, attributes):
+        """Test String(255) with nullable=False is a required String."""
+        assert attributes['title']['type'] == 'String'
+        assert attributes['title']['pydantic_type'] == 'str'
+        assert attributes['title']['required'] is True
+
+    def test_multi_line_column(self, attributes):
+        """Test a Column call spread over several lines."""
+        assert attributes['body']['type'] == 'Text'
+        assert attributes['body']['required'] is True
+
+    def test_qualified_type(self, attributes):
+        """Test sa.Column(sa.Text) without nullable keeps the Text default."""
+        assert attributes['summary']['type'] == 'Text'
+        assert attributes['summary']['required'] is False
+
+    def test_leading_name_string(self, attributes):
+        """Test the type is found after a leading column name string."""
+        assert attributes['views']['type'] == 'Integer'
+        assert attributes['views']['test_value'] == '42'
+        assert attributes['views']['required'] is False
+
+    def test_annotated_column(self, attributes):
+        """Test annotated assignments are picked up."""
+        assert attributes['slug']['type'] == 'String'
+        assert attributes['slug']['required'] is True